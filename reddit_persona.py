@@ -1,64 +1,315 @@
+import orjson
 import praw
-from collections import defaultdict
+import requests
+from praw.exceptions import PRAWException
+from prawcore.exceptions import PrawcoreException
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+import threading
 import re
-import datetime
+import time
 import configparser
 import os
-from typing import List, Dict, Tuple
+from typing import Callable, Dict, FrozenSet, Iterable, Iterator, List, Optional, Pattern, Set, Tuple
+
+# (persona bucket, category) -> keywords matched as whole words or phrases, in report order.
+# Keywords that are not words at all (e.g. '?') are matched anywhere in the text.
+COMMENT_KEYWORDS = {
+    ('interests', 'programming'): ['python', 'javascript', 'java', 'c++'],
+    ('interests', 'gaming'): ['game', 'games', 'gaming', 'playstation', 'xbox'],
+    ('interests', 'movies'): ['movie', 'movies', 'film', 'films', 'netflix', 'hbo'],
+    ('personality_traits', 'opinionated'): ['i think', 'in my opinion'],
+    ('personality_traits', 'inquisitive'): ['?'],
+    ('personality_traits', 'polite'): ['thanks', 'thank you', 'appreciate'],
+}
+
+POST_KEYWORDS = {
+    ('interests', 'help_seeking'): ['help', 'advice', 'suggestion', 'suggestions'],
+    ('interests', 'discussions'): ['discussion', 'discussions', 'debate', 'opinion', 'opinions'],
+}
+
+# Citations kept per interest/trait; only counts are needed for ranking
+MAX_CITATIONS = 3
+
+# Permalinks are stored as paths and only joined with the host in the report
+REDDIT_URL = 'https://reddit.com'
+
+# Fetched user data is reused from disk for a day before hitting the API again
+CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'reddit_persona')
+CACHE_TTL = 24 * 60 * 60
+# Bump whenever the shape of the cached user_info changes
+CACHE_VERSION = 2
+
+# Seconds to wait on the public JSON endpoint before falling back to PRAW
+FAST_FETCH_TIMEOUT = 10
+
+# Time of day for each UTC hour: 5-11 morning, 12-16 afternoon, 17-21 evening, else night
+_HOUR_BUCKET = ('night',) * 5 + ('morning',) * 7 + ('afternoon',) * 5 + ('evening',) * 5 + ('night',) * 2
+
+_SELF_REF_RE = re.compile(r"\b(?:i'm|i am|me|my)\b")
+_WORD_RE = re.compile(r"[a-z][a-z+]*")
+
+Matcher = Tuple[Tuple[str, str], FrozenSet[str], Optional[Pattern]]
+
+def _build_matchers(keywords: Dict[Tuple[str, str], List[str]]) -> List[Matcher]:
+    """Split each category's keywords into a word set and a regex for everything else"""
+    matchers = []
+    for tag, category_keywords in keywords.items():
+        words = frozenset(kw for kw in category_keywords if _WORD_RE.fullmatch(kw))
+        phrases = [r'\b' + re.escape(kw) + r'\b' for kw in category_keywords if ' ' in kw]
+        symbols = [re.escape(kw) for kw in category_keywords
+                   if ' ' not in kw and not _WORD_RE.fullmatch(kw)]
+        pattern = re.compile('|'.join(phrases + symbols)) if phrases or symbols else None
+        matchers.append((tag, words, pattern))
+    return matchers
+
+def _match_keywords(text: str, matchers: List[Matcher],
+                    words: Optional[Set[str]] = None) -> List[Tuple[str, str]]:
+    """Return the (bucket, category) tags whose keywords occur in text as whole words
+    
+    Pass `words` (the _WORD_RE tokens of text) when the caller already has them.
+    """
+    if words is None:
+        words = set(_WORD_RE.findall(text))
+    return [tag for tag, keywords, pattern in matchers
+            if not words.isdisjoint(keywords) or (pattern and pattern.search(text))]
+
+_COMMENT_MATCHERS = _build_matchers(COMMENT_KEYWORDS)
+_POST_MATCHERS = _build_matchers(POST_KEYWORDS)
+_COMMENT_INTERESTS = [category for bucket, category in COMMENT_KEYWORDS if bucket == 'interests']
+_POST_INTERESTS = [category for bucket, category in POST_KEYWORDS if bucket == 'interests']
+
+class MalformedListingError(requests.RequestException):
+    """The public JSON endpoint answered with a payload of an unexpected shape"""
 
 class RedditPersonaGenerator:
+    # Shared PRAW client, created on first use. PRAW is not thread-safe, so
+    # every request made through it from a worker thread holds _praw_lock.
+    _reddit = None
+    _praw_lock = threading.Lock()
+    
     def __init__(self):
         self.config = configparser.ConfigParser()
         self.config.read('praw.ini')
-
-        self.reddit = praw.Reddit(
-            client_id=self.config['REDDIT']['client_id'],
-            client_secret=self.config['REDDIT']['client_secret'],
-            user_agent=self.config['REDDIT']['user_agent']
-        )
         
-    def extract_user_info(self, username: str) -> Dict:
-        """Extract user information and activity from Reddit"""
+    @property
+    def reddit(self) -> praw.Reddit:
+        if RedditPersonaGenerator._reddit is None:
+            RedditPersonaGenerator._reddit = praw.Reddit(
+                client_id=self.config['REDDIT']['client_id'],
+                client_secret=self.config['REDDIT']['client_secret'],
+                user_agent=self.config['REDDIT']['user_agent']
+            )
+        return RedditPersonaGenerator._reddit
+        
+    def extract_user_info(self, username: str, comment_limit: int = 100, post_limit: int = 50,
+                          early_stop: Optional[int] = None) -> Dict:
+        """Extract user information and activity from Reddit
+        
+        If early_stop is set, each listing stops being fetched once every
+        interest category it can contribute to has at least that many hits.
+        """
+        cache_key = f"{username.lower()}_{comment_limit}_{post_limit}_{early_stop or 0}"
+        user_info = self._load_cached_user_info(cache_key)
+        if user_info is not None:
+            return user_info
+            
         user = self.reddit.redditor(username)
         
         try:
+            # Suspended accounts' /about only has name and is_suspended, so any
+            # other profile field would raise AttributeError below.
+            if getattr(user, 'is_suspended', False):
+                print(f"Error fetching user data: u/{username} is suspended")
+                return None
+                
+            # These all come from a single /about request that PRAW makes on first
+            # attribute access; only read fields the persona actually uses.
             user_info = {
                 'username': username,
-                'created_utc': datetime.datetime.fromtimestamp(user.created_utc).strftime('%Y-%m-%d'),
+                'created_utc': user.created_utc,
                 'comment_karma': user.comment_karma,
                 'link_karma': user.link_karma,
-                'is_mod': user.is_mod,
                 'is_gold': user.is_gold,
                 'comments': [],
                 'posts': []
             }
-            for comment in user.comments.new(limit=100):
-                user_info['comments'].append({
-                    'body': comment.body,
-                    'subreddit': str(comment.subreddit),
-                    'created_utc': datetime.datetime.fromtimestamp(comment.created_utc).strftime('%Y-%m-%d'),
-                    'score': comment.score,
-                    'permalink': f"https://reddit.com{comment.permalink}"
-                })
-            
-            # Get recent posts (limit to 50)
-            for submission in user.submissions.new(limit=50):
-                user_info['posts'].append({
-                    'title': submission.title,
-                    'selftext': submission.selftext,
-                    'subreddit': str(submission.subreddit),
-                    'created_utc': datetime.datetime.fromtimestamp(submission.created_utc).strftime('%Y-%m-%d'),
-                    'score': submission.score,
-                    'permalink': f"https://reddit.com{submission.permalink}",
-                    'is_self': submission.is_self,
-                    'url': submission.url
-                })
+            # Comments and posts are independent listings, so fetch them side by side.
+            # Two workers keeps us well inside Reddit's rate limits. Only the public
+            # JSON requests actually overlap; the PRAW fallback is serialized by
+            # _praw_lock since both threads would share one PRAW session.
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                comments = executor.submit(self._fetch_comments, user, comment_limit, early_stop)
+                posts = executor.submit(self._fetch_submissions, user, post_limit, early_stop)
+                user_info['comments'] = comments.result()
+                user_info['posts'] = posts.result()
                 
-            return user_info
-            
-        except Exception as e:
+        except (PrawcoreException, PRAWException, requests.RequestException) as e:
             print(f"Error fetching user data: {e}")
             return None
+            
+        self._save_cached_user_info(cache_key, user_info)
+        return user_info
+    
+    def _cache_path(self, cache_key: str) -> str:
+        return os.path.join(CACHE_DIR, f"{cache_key}.v{CACHE_VERSION}.json")
+    
+    def _load_cached_user_info(self, cache_key: str) -> Optional[Dict]:
+        """Return cached user data if it is younger than CACHE_TTL"""
+        path = self._cache_path(cache_key)
+        try:
+            if time.time() - os.path.getmtime(path) > CACHE_TTL:
+                return None
+            with open(path, 'rb') as f:
+                return orjson.loads(f.read())
+        except (OSError, ValueError):
+            return None
+    
+    def _save_cached_user_info(self, cache_key: str, user_info: Dict):
+        try:
+            os.makedirs(CACHE_DIR, exist_ok=True)
+            with open(self._cache_path(cache_key), 'wb') as f:
+                f.write(orjson.dumps(user_info))
+        except OSError as e:
+            print(f"Warning: could not write cache: {e}")
+    
+    def _fast_fetch(self, username: str, kind: str, limit: int,
+                    from_json: Callable[[Dict], Dict]) -> Iterator[List[Dict]]:
+        """Yield pages of a user listing from Reddit's public JSON endpoint, up to 100 items each
+        
+        Pages are requested lazily, so a consumer that stops early saves the remaining requests.
+        Items are converted with from_json; a payload of the wrong shape raises
+        MalformedListingError.
+        """
+        remaining = limit
+        after = None
+        while remaining > 0:
+            params = {'limit': min(100, remaining), 'sort': 'new', 'raw_json': 1}
+            if after:
+                params['after'] = after
+            response = requests.get(
+                f"https://www.reddit.com/user/{username}/{kind}.json",
+                params=params,
+                headers={'User-Agent': self.config['REDDIT']['user_agent']},
+                timeout=FAST_FETCH_TIMEOUT
+            )
+            response.raise_for_status()
+            try:
+                data = response.json()['data']
+                page = [from_json(child['data']) for child in data['children'][:remaining]]
+                after = data['after']
+            except (ValueError, KeyError, TypeError) as e:
+                raise MalformedListingError(f"Unexpected {kind} listing payload: {e!r}") from e
+            yield page
+            remaining -= len(page)
+            if not after or not page:
+                break
+    
+    def _iter_listing(self, username: str, kind: str, limit: int, from_json: Callable[[Dict], Dict],
+                      praw_listing: Callable[[], Iterable], from_praw: Callable) -> Iterator[Dict]:
+        """Yield listing items from the JSON endpoint, or from PRAW if its first page fails
+        
+        The source is chosen on the first page only; a later failure is raised
+        rather than switching sources after items have already been yielded.
+        """
+        pages = self._fast_fetch(username, kind, limit, from_json)
+        try:
+            first_page = next(pages, [])
+        except requests.RequestException:
+            # Public endpoint refused or returned something unexpected; use the API.
+            # Page requests happen inside next(), so only that is done under the lock.
+            items = iter(praw_listing())
+            while True:
+                with self._praw_lock:
+                    item = next(items, None)
+                if item is None:
+                    return
+                yield from_praw(item)
+            
+        yield from first_page
+        for page in pages:
+            yield from page
+    
+    def _comment_from_json(self, data: Dict) -> Dict:
+        return {
+            'body': data['body'],
+            'subreddit': data['subreddit'],
+            'created_utc': data['created_utc'],
+            'score': data['score'],
+            'permalink': data['permalink']
+        }
+    
+    def _comment_from_praw(self, comment) -> Dict:
+        return {
+            'body': comment.body,
+            'subreddit': comment.subreddit.display_name,
+            'created_utc': comment.created_utc,
+            'score': comment.score,
+            'permalink': comment.permalink
+        }
+    
+    def _submission_from_json(self, data: Dict) -> Dict:
+        return {
+            'title': data['title'],
+            'selftext': data['selftext'],
+            'subreddit': data['subreddit'],
+            'created_utc': data['created_utc'],
+            'score': data['score'],
+            'permalink': data['permalink'],
+            'is_self': data['is_self'],
+            'url': data['url']
+        }
+    
+    def _submission_from_praw(self, submission) -> Dict:
+        return {
+            'title': submission.title,
+            'selftext': submission.selftext,
+            'subreddit': submission.subreddit.display_name,
+            'created_utc': submission.created_utc,
+            'score': submission.score,
+            'permalink': submission.permalink,
+            'is_self': submission.is_self,
+            'url': submission.url
+        }
+    
+    def _fetch_comments(self, user, limit: int, early_stop: Optional[int] = None) -> List[Dict]:
+        """Fetch up to `limit` of the user's recent comments"""
+        listing = self._iter_listing(
+            user.name, 'comments', limit, self._comment_from_json,
+            lambda: user.comments.new(limit=limit), self._comment_from_praw
+        )
+        comments = []
+        hits = Counter(dict.fromkeys(_COMMENT_INTERESTS, 0))
+        for comment in listing:
+            comments.append(comment)
+            if early_stop and self._has_enough_samples(
+                    comment['body'].lower(), _COMMENT_MATCHERS, hits, early_stop):
+                break
+        return comments
+    
+    def _fetch_submissions(self, user, limit: int, early_stop: Optional[int] = None) -> List[Dict]:
+        """Fetch up to `limit` of the user's recent posts"""
+        listing = self._iter_listing(
+            user.name, 'submitted', limit, self._submission_from_json,
+            lambda: user.submissions.new(limit=limit), self._submission_from_praw
+        )
+        posts = []
+        hits = Counter(dict.fromkeys(_POST_INTERESTS, 0))
+        for post in listing:
+            posts.append(post)
+            if early_stop and self._has_enough_samples(
+                    (post['title'] + ' ' + post['selftext']).lower(),
+                    _POST_MATCHERS, hits, early_stop):
+                break
+        return posts
+    
+    def _has_enough_samples(self, text: str, matchers: List[Matcher],
+                            hits: Counter, early_stop: int) -> bool:
+        """Tally one item's interest hits; True once every category in `hits` has early_stop"""
+        for bucket, category in _match_keywords(text, matchers):
+            if bucket == 'interests':
+                hits[category] += 1
+        return min(hits.values()) >= early_stop
     
     def analyze_persona(self, user_info: Dict) -> Dict:
         """Analyze user data to build a persona"""
@@ -70,139 +321,132 @@ class RedditPersonaGenerator:
                 'Post Karma': user_info['link_karma'],
                 'Premium Member': user_info['is_gold']
             },
-            'interests': defaultdict(list),
-            'personality_traits': defaultdict(list),
-            'frequent_subreddits': defaultdict(int),
+            'interests_count': Counter(),
+            'interests_samples': defaultdict(list),
+            'personality_traits_count': Counter(),
+            'personality_traits_samples': defaultdict(list),
+            'frequent_subreddits': Counter(),
             'activity_patterns': defaultdict(int),
             'language_style': defaultdict(int)
         }
         
+        # Hoist the buckets into locals so the per-item loops below avoid
+        # repeated persona[...] lookups and helper calls.
+        interests_count = persona['interests_count']
+        traits_count = persona['personality_traits_count']
+        counts = {'interests': interests_count, 'personality_traits': traits_count}
+        samples = {'interests': persona['interests_samples'],
+                   'personality_traits': persona['personality_traits_samples']}
+        subreddits = persona['frequent_subreddits']
+        activity = persona['activity_patterns']
+        language_style = persona['language_style']
+        
+        def cite(bucket: str, category: str, permalink: str):
+            """Count a hit for a category and keep the first few permalinks as citations"""
+            counts[bucket][category] += 1
+            cited = samples[bucket][category]
+            if len(cited) < MAX_CITATIONS:
+                cited.append(permalink)
+                
         for comment in user_info['comments']:
-            self._analyze_comment(comment, persona)
-            persona['frequent_subreddits'][comment['subreddit']] += 1
-            self._analyze_activity_time(comment['created_utc'], persona)
+            # Lowercase and tokenize once; every check below works off text/words/tokens.
+            # str.split() is already a single C-level pass for the word count, while
+            # keyword matching needs punctuation-free words.
+            text = comment['body'].lower()
+            words = set(_WORD_RE.findall(text))
+            tokens = text.split()
+            permalink = comment['permalink']
+            
+            for bucket, category in _match_keywords(text, _COMMENT_MATCHERS, words):
+                cite(bucket, category, permalink)
+                
+            language_style['comment_length'] += len(tokens)
+            if '!' in text:
+                language_style['exclamation_use'] += 1
+            if _SELF_REF_RE.search(text):
+                language_style['self_reference'] += 1
+                
+            subreddits[comment['subreddit']] += 1
+            
+            # Activity buckets use UTC hours
+            activity[_HOUR_BUCKET[time.gmtime(comment['created_utc']).tm_hour]] += 1
             
         for post in user_info['posts']:
-            self._analyze_post(post, persona)
-            persona['frequent_subreddits'][post['subreddit']] += 1
-            self._analyze_activity_time(post['created_utc'], persona)
+            text = (post['title'] + ' ' + post.get('selftext', '')).lower()
+            permalink = post['permalink']
+            
+            for bucket, category in _match_keywords(text, _POST_MATCHERS):
+                cite(bucket, category, permalink)
+            if '?' in post['title']:
+                cite('personality_traits', 'inquisitive', permalink)
+                
+            subreddits[post['subreddit']] += 1
+            
+            activity[_HOUR_BUCKET[time.gmtime(post['created_utc']).tm_hour]] += 1
             
-        persona['top_interests'] = sorted(
-            persona['interests'].items(), 
-            key=lambda x: len(x[1]), 
-            reverse=True
-        )[:5]
-        
-        persona['top_subreddits'] = sorted(
-            persona['frequent_subreddits'].items(), 
-            key=lambda x: x[1], 
-            reverse=True
-        )[:5]
+        persona['top_interests'] = interests_count.most_common(5)
+        
+        persona['top_subreddits'] = subreddits.most_common(5)
         
         return persona
     
-    def _calculate_account_age(self, created_date: str) -> str:
-        created = datetime.datetime.strptime(created_date, '%Y-%m-%d')
-        delta = datetime.datetime.now() - created
-        years = delta.days // 365
-        months = (delta.days % 365) // 30
+    def _calculate_account_age(self, created_utc: float) -> str:
+        days = int((time.time() - created_utc) // 86400)
+        years, remainder = divmod(days, 365)
+        months = remainder // 30
         return f"{years} years, {months} months"
     
-    def _analyze_comment(self, comment: Dict, persona: Dict):
-        text = comment['body'].lower()
-        
-        if any(tech in text for tech in ['python', 'javascript', 'java', 'c++']):
-            persona['interests']['programming'].append(comment['permalink'])
-        if any(word in text for word in ['game', 'gaming', 'playstation', 'xbox']):
-            persona['interests']['gaming'].append(comment['permalink'])
-        if any(word in text for word in ['movie', 'film', 'netflix', 'hbo']):
-            persona['interests']['movies'].append(comment['permalink'])
-        
-        if any(word in text for word in ['i think', 'in my opinion']):
-            persona['personality_traits']['opinionated'].append(comment['permalink'])
-        if '?' in text:
-            persona['personality_traits']['inquisitive'].append(comment['permalink'])
-        if any(word in text for word in ['thanks', 'thank you', 'appreciate']):
-            persona['personality_traits']['polite'].append(comment['permalink'])
-            
-        persona['language_style']['comment_length'] += len(text.split())
-        if '!' in text:
-            persona['language_style']['exclamation_use'] += 1
-        if re.search(r'\b(i\'m|i am|me|my)\b', text):
-            persona['language_style']['self_reference'] += 1
-    
-    def _analyze_post(self, post: Dict, persona: Dict):
-        """Analyze a single post for persona traits"""
-        text = (post['title'] + ' ' + post.get('selftext', '')).lower()
-        
-        if any(word in text for word in ['help', 'advice', 'suggestion']):
-            persona['interests']['help_seeking'].append(post['permalink'])
-        if any(word in text for word in ['discussion', 'debate', 'opinion']):
-            persona['interests']['discussions'].append(post['permalink'])
-        if '?' in post['title']:
-            persona['personality_traits']['inquisitive'].append(post['permalink'])
-            
-    def _analyze_activity_time(self, timestamp: str, persona: Dict):
-        """Analyze when the user is most active"""
-        dt = datetime.datetime.strptime(timestamp, '%Y-%m-%d')
-        hour = dt.hour
-        
-        if 5 <= hour < 12:
-            persona['activity_patterns']['morning'] += 1
-        elif 12 <= hour < 17:
-            persona['activity_patterns']['afternoon'] += 1
-        elif 17 <= hour < 22:
-            persona['activity_patterns']['evening'] += 1
-        else:
-            persona['activity_patterns']['night'] += 1
-    
     def generate_persona_file(self, persona: Dict, filename: str):
         """Generate a text file with the persona analysis"""
+        parts = []
+        append = parts.append
+        append("=== REDDIT USER PERSONA ===\n\n")
+        
+        append("== BASIC INFORMATION ==\n")
+        for key, value in persona['basic_info'].items():
+            append(f"{key}: {value}\n")
+        append("\n")
+        
+        append("== TOP INTERESTS ==\n")
+        for interest, count in persona['top_interests']:
+            append(f"- {interest.capitalize()} (based on {count} comments/posts)\n")
+            for url in persona['interests_samples'][interest]:
+                append(f"  - Citation: {REDDIT_URL}{url}\n")
+        append("\n")
+        
+        append("== PERSONALITY TRAITS ==\n")
+        for trait, count in persona['personality_traits_count'].items():
+            append(f"- {trait.capitalize()} (based on {count} comments/posts)\n")
+            for url in persona['personality_traits_samples'][trait][:2]:
+                append(f"  - Citation: {REDDIT_URL}{url}\n")
+        append("\n")
+        
+        append("== ACTIVITY PATTERNS ==\n")
+        total_activity = sum(persona['activity_patterns'].values())
+        for period, count in persona['activity_patterns'].items():
+            percentage = (count / total_activity) * 100
+            append(f"- Most active during {period}: {percentage:.1f}% of activity\n")
+        append("\n")
+        
+        append("== LANGUAGE STYLE ==\n")
+        if persona['language_style']['comment_length'] > 0:
+            avg_length = persona['language_style']['comment_length'] / \
+                       (len(persona['personality_traits_count']) + len(persona['interests_count']))
+            append(f"- Average comment length: {avg_length:.1f} words\n")
+        if persona['language_style']['exclamation_use'] > 0:
+            append("- Frequently uses exclamation marks\n")
+        if persona['language_style']['self_reference'] > 0:
+            append("- Often uses self-referential language (I, me, my)\n")
+        append("\n")
+        
+        append("== FREQUENTLY VISITED SUBREDDITS ==\n")
+        for subreddit, count in persona['top_subreddits']:
+            append(f"- r/{subreddit}: {count} interactions\n")
+        
+        append("\n=== END OF PERSONA ===")
+        
         with open(filename, 'w', encoding='utf-8') as f:
-            f.write("=== REDDIT USER PERSONA ===\n\n")
-            
-            f.write("== BASIC INFORMATION ==\n")
-            for key, value in persona['basic_info'].items():
-                f.write(f"{key}: {value}\n")
-            f.write("\n")
-            
-            f.write("== TOP INTERESTS ==\n")
-            for interest, citations in persona['top_interests']:
-                f.write(f"- {interest.capitalize()} (based on {len(citations)} comments/posts)\n")
-                for url in citations[:3]:  # Show top 3 citations
-                    f.write(f"  - Citation: {url}\n")
-            f.write("\n")
-            
-            f.write("== PERSONALITY TRAITS ==\n")
-            for trait, citations in persona['personality_traits'].items():
-                f.write(f"- {trait.capitalize()} (based on {len(citations)} comments/posts)\n")
-                for url in citations[:2]:
-                    f.write(f"  - Citation: {url}\n")
-            f.write("\n")
-            
-            f.write("== ACTIVITY PATTERNS ==\n")
-            total_activity = sum(persona['activity_patterns'].values())
-            for time, count in persona['activity_patterns'].items():
-                percentage = (count / total_activity) * 100
-                f.write(f"- Most active during {time}: {percentage:.1f}% of activity\n")
-            f.write("\n")
-            
-            f.write("== LANGUAGE STYLE ==\n")
-            if persona['language_style']['comment_length'] > 0:
-                avg_length = persona['language_style']['comment_length'] / \
-                           (len(persona['personality_traits']) + len(persona['interests']))
-                f.write(f"- Average comment length: {avg_length:.1f} words\n")
-            if persona['language_style']['exclamation_use'] > 0:
-                f.write("- Frequently uses exclamation marks\n")
-            if persona['language_style']['self_reference'] > 0:
-                f.write("- Often uses self-referential language (I, me, my)\n")
-            f.write("\n")
-            
-            f.write("== FREQUENTLY VISITED SUBREDDITS ==\n")
-            for subreddit, count in persona['top_subreddits']:
-                f.write(f"- r/{subreddit}: {count} interactions\n")
-            
-            f.write("\n=== END OF PERSONA ===")
+            f.write(''.join(parts))
 
 def main():
     print("Reddit User Persona Generator")